@@ -1,17 +1,62 @@
+from __future__ import annotations
+
 import argparse
+import math
 import sys
+import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
 import re
 
-import pandas as pd
 import serial
 
-
-ROW_PATTERN = re.compile(
-    r"^\s*([0-9]+(?:\.[0-9]+)?)\s*,\s*([0-9]+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+(?:\.\d+)?)"
-)
+# pandas/numpy are imported lazily inside the functions that need them;
+# their cold-start cost (several hundred ms) would otherwise be paid even
+# when the run fails before any samples are collected, or for --help.
+
+
+# Row layout: elapsed_s, sample_ms, raw_adc, avg_20, filtered_20, zeroed_adc, strain_uE
+# (previously validated with a 7-group regex; parse_row now splits on commas directly
+# and only uses this cheap leading-digit check to reject banner/status lines early).
+_NUMERIC_RE = re.compile(r"^-?\d")
+
+# Cell format specs for write_excel, hoisted so each workbook registers one
+# Format per distinct style. The old head_fmt and label_fmt dicts were
+# identical, so they share the "head" entry.
+_FORMAT_SPECS = {
+    "title": {"bold": True, "font_size": 13, "align": "left", "valign": "vcenter"},
+    "head": {"bold": True, "bg_color": "#D9E1F2", "border": 1, "align": "center", "valign": "vcenter"},
+    "input_head": {"bold": True, "bg_color": "#FFF2CC", "border": 1, "align": "left", "valign": "vcenter"},
+    "input_cell": {"border": 1, "bg_color": "#FFFBE6", "align": "left", "valign": "vcenter"},
+    "high_strain": {"bg_color": "#FCE4D6", "font_color": "#9C0006"},
+    "center_cell": {"align": "center", "valign": "vcenter"},
+    "section": {"bold": True, "bg_color": "#4F81BD", "font_color": "#FFFFFF", "align": "center", "valign": "vcenter", "border": 1},
+    "value": {"align": "center", "valign": "vcenter", "border": 1},
+    "avg_value": {"bold": True, "bg_color": "#FFF2CC", "align": "center", "valign": "vcenter", "border": 1},
+}
+
+ROW_COLUMNS = [
+    "elapsed_s",
+    "sample_ms",
+    "raw_adc",
+    "avg_20",
+    "filtered_20",
+    "zeroed_adc",
+    "strain_uE",
+]
+
+
+_MKDIR_CACHE: set[Path] = set()
+
+# Echoed serial lines are written straight to stdout and flushed in batches;
+# a flush per line is a syscall per sample at high rates. The time-based
+# fallback keeps low-rate output (tare banners, a silent port) visible.
+_FLUSH_EVERY = 50
+_FLUSH_INTERVAL_S = 0.1
+
+# Rows per Arrow record batch when spilling the capture to a temp file.
+_SPILL_CHUNK_ROWS = 4096
 
 
 def build_output_path(workspace_root: Path) -> Path:
@@ -26,7 +71,9 @@ def sanitize_label(label: str) -> str:
 
 def build_output_path_with_label(workspace_root: Path, label: str | None) -> Path:
     output_dir = workspace_root / "excel-results"
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if output_dir not in _MKDIR_CACHE:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(output_dir)
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     if label:
         safe = sanitize_label(label)
@@ -34,193 +81,416 @@ def build_output_path_with_label(workspace_root: Path, label: str | None) -> Pat
     return output_dir / f"monitor_session_{stamp}.xlsx"
 
 
-def parse_row(line: str):
-    match = ROW_PATTERN.match(line)
-    if not match:
+# parse_row is the hottest function in the capture loop, so it is generated
+# once at import with float/int/the regex matcher bound as default arguments.
+# Default-arg bindings are local-variable loads at call time, skipping the
+# global lookups a hand-written version would pay per row. It returns a tuple
+# in ROW_COLUMNS order, or None for banner/malformed lines.
+_PARSE_ROW_SRC = """\
+def parse_row(line, _f=float, _i=int, _m=_NUMERIC_RE.match):
+    parts = line.strip().split(",")
+    if len(parts) < 7 or not _m(parts[0].lstrip()):
+        return None
+    try:
+        return (
+            _f(parts[0]),
+            _i(parts[1]),
+            _i(parts[2]),
+            _i(parts[3]),
+            _i(parts[4]),
+            _i(parts[5]),
+            _f(parts[6].split()[0]),
+        )
+    except (ValueError, IndexError):
         return None
+"""
 
-    return {
-        "elapsed_s": float(match.group(1)),
-        "sample_ms": int(match.group(2)),
-        "raw_adc": int(match.group(3)),
-        "avg_20": int(match.group(4)),
-        "filtered_20": int(match.group(5)),
-        "zeroed_adc": int(match.group(6)),
-        "strain_uE": float(match.group(7)),
-    }
+_parse_ns = {"_NUMERIC_RE": _NUMERIC_RE}
+exec(_PARSE_ROW_SRC, _parse_ns)
+parse_row = _parse_ns["parse_row"]
 
 
 def run_tare_before_monitor(ser: serial.Serial, tare_timeout_s: float = 60.0):
     print("Sending 'z' command to tare strain gauge before monitoring...\n")
+    sys.stdout.flush()
+    # No flush needed: the OS transmits these one/two-byte commands
+    # immediately, and flush blocks until the driver confirms the drain.
     ser.write(b"z")
-    ser.flush()
 
-    tare_start = time.time()
+    tare_deadline = time.monotonic() + tare_timeout_s
     saw_tare_banner = False
+    buf = bytearray()
+    out_write = sys.stdout.write
+    line_count = 0
+    last_flush = time.monotonic()
 
     while True:
-        if (time.time() - tare_start) > tare_timeout_s:
+        now = time.monotonic()
+        if now > tare_deadline:
             raise RuntimeError("Tare timed out before completion.")
 
-        raw = ser.readline()
-        if not raw:
-            continue
+        if now - last_flush >= _FLUSH_INTERVAL_S:
+            sys.stdout.flush()
+            last_flush = now
 
-        line = raw.decode("utf-8", errors="ignore").strip()
-        if not line:
+        chunk = ser.read(ser.in_waiting or 1)
+        if not chunk:
             continue
+        buf.extend(chunk)
+
+        while True:
+            idx = buf.find(b"\n")
+            if idx < 0:
+                break
+            raw = bytes(buf[:idx])
+            del buf[: idx + 1]
 
-        print(line)
+            line = raw.decode("utf-8", errors="ignore").strip()
+            if not line:
+                continue
+
+            out_write(line)
+            out_write("\n")
+            line_count += 1
+            if line_count % _FLUSH_EVERY == 0:
+                sys.stdout.flush()
+                last_flush = time.monotonic()
+
+            if "=== TARING STRAIN GAUGE ===" in line:
+                saw_tare_banner = True
 
-        if "=== TARING STRAIN GAUGE ===" in line:
-            saw_tare_banner = True
+            if "Strain gauge zeroed successfully!" in line:
+                print("\nTare complete. Starting continuous monitor...\n")
+                sys.stdout.flush()
+                return
 
-        if "Strain gauge zeroed successfully!" in line:
-            print("\nTare complete. Starting continuous monitor...\n")
-            return
+            if "Failed to zero strain gauge!" in line:
+                raise RuntimeError("Firmware reported tare failure.")
 
-        if "Failed to zero strain gauge!" in line:
-            raise RuntimeError("Firmware reported tare failure.")
+            if saw_tare_banner and "===========================" in line:
+                raise RuntimeError("Tare ended without a success message.")
 
-        if saw_tare_banner and "===========================" in line:
-            raise RuntimeError("Tare ended without a success message.")
+
+def _open_row_spill():
+    """Set up the Arrow IPC temp file parsed rows are streamed into.
+
+    Returns (pa, schema, path, sink, writer), or all Nones when pyarrow is
+    not installed and rows stay in memory instead.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None, None, None, None, None
+
+    schema = pa.schema(
+        [
+            ("elapsed_s", pa.float64()),
+            ("sample_ms", pa.int32()),
+            ("raw_adc", pa.int32()),
+            ("avg_20", pa.int32()),
+            ("filtered_20", pa.int32()),
+            ("zeroed_adc", pa.int32()),
+            ("strain_uE", pa.float32()),
+        ]
+    )
+    tmp = tempfile.NamedTemporaryFile(suffix=".arrow", delete=False)
+    tmp.close()
+    path = Path(tmp.name)
+    sink = pa.OSFile(tmp.name, "wb")
+    writer = pa.ipc.new_stream(sink, schema)
+    return pa, schema, path, sink, writer
 
 
 def capture_monitor_session(port: str, baud: int, duration: float | None, timeout: float):
     rows = []
+
+    # Parsed rows are streamed to a temp Arrow file in _SPILL_CHUNK_ROWS
+    # batches so capture memory stays bounded for arbitrarily long sessions;
+    # `rows` then only ever holds the current pending batch.
+    pa, spill_schema, spill_path, spill_sink, spill_writer = _open_row_spill()
+
+    def spill_rows():
+        cols = list(zip(*rows))
+        arrays = [pa.array(col, type=field.type) for col, field in zip(cols, spill_schema)]
+        spill_writer.write_batch(pa.record_batch(arrays, schema=spill_schema))
+        rows.clear()
+
+    try:
+        total_rows = _run_capture(
+            port, baud, duration, timeout, rows, spill_writer is not None, spill_rows
+        )
+
+        if not total_rows:
+            raise RuntimeError(
+                "No monitoring samples captured. Verify COM port/baud and that firmware includes monitor output."
+            )
+
+        import numpy as np
+        import pandas as pd
+
+        if spill_writer is not None:
+            if rows:
+                spill_rows()
+            spill_writer.close()
+            spill_sink.close()
+            spill_writer = None
+            with pa.OSFile(str(spill_path), "rb") as src:
+                # Columns come back already downcast per the spill schema.
+                df = pa.ipc.open_stream(src).read_all().to_pandas()
+        else:
+            df = pd.DataFrame(rows, columns=ROW_COLUMNS)
+            # Downcast everything the firmware emits at limited precision;
+            # only elapsed_s stays float64 since the interval math depends
+            # on it.
+            df = df.astype(
+                {
+                    "sample_ms": np.int32,
+                    "raw_adc": np.int32,
+                    "avg_20": np.int32,
+                    "filtered_20": np.int32,
+                    "zeroed_adc": np.int32,
+                    "strain_uE": np.float32,
+                    "elapsed_s": np.float64,
+                }
+            )
+
+        df.insert(0, "sample", np.arange(1, len(df) + 1, dtype=np.int32))
+        # Single preallocated buffer instead of Series.diff -> multiply ->
+        # fillna (three intermediate allocations on long captures).
+        elapsed = df["elapsed_s"].to_numpy()
+        intervals = np.empty_like(elapsed)
+        intervals[0] = df["sample_ms"].iat[0]
+        np.subtract(elapsed[1:], elapsed[:-1], out=intervals[1:])
+        intervals[1:] *= 1000.0
+        df["entry_interval_ms"] = intervals
+
+        return df
+    finally:
+        if spill_writer is not None:
+            spill_writer.close()
+            spill_sink.close()
+        if spill_path is not None:
+            spill_path.unlink(missing_ok=True)
+
+
+def _run_capture(port, baud, duration, timeout, rows, spill_enabled, spill_rows):
+    total_rows = 0
     collecting = False
     sent_stop = False
     monitor_start_wall = None
 
-    with serial.Serial(port=port, baudrate=baud, timeout=0.5) as ser:
+    with serial.Serial(port=port, baudrate=baud, timeout=0.01) as ser:
         ser.reset_input_buffer()
         ser.reset_output_buffer()
 
         run_tare_before_monitor(ser)
 
-        while ser.in_waiting:
-            ser.read()
+        # Drop any stale bytes left over from the tare output in one call.
+        ser.reset_input_buffer()
 
         ser.write(b"m")
-        ser.flush()
         print("Sent 'm' command to firmware. Waiting for monitoring output...\n")
-
-        start_wall = time.time()
-
-        while True:
-            if timeout > 0 and (time.time() - start_wall) > timeout:
+        sys.stdout.flush()
+
+        # monotonic deadlines computed once; time.time() has coarse
+        # resolution on Windows and can jump with clock adjustments.
+        deadline_wall = time.monotonic() + timeout if timeout > 0 else math.inf
+        duration_deadline = math.inf
+        buf = bytearray()
+        session_ended = False
+        out_write = sys.stdout.write
+        line_count = 0
+        last_flush = time.monotonic()
+
+        while not session_ended:
+            now = time.monotonic()
+            if now - last_flush >= _FLUSH_INTERVAL_S:
+                sys.stdout.flush()
+                last_flush = now
+
+            if now > deadline_wall:
                 if collecting and not sent_stop:
                     ser.write(b"x\n")
-                    ser.flush()
                     sent_stop = True
                     print("Timeout reached. Sent stop command.")
                 else:
                     break
 
-            raw = ser.readline()
-            if not raw:
+            # Drain whatever has accumulated in one read instead of a
+            # readline() per sample, then process every complete line.
+            chunk = ser.read(ser.in_waiting or 1)
+            if not chunk:
                 continue
+            buf.extend(chunk)
 
-            line = raw.decode("utf-8", errors="ignore").strip()
-            if not line:
-                continue
+            while True:
+                idx = buf.find(b"\n")
+                if idx < 0:
+                    break
+                raw = bytes(buf[:idx])
+                del buf[: idx + 1]
+
+                line = raw.decode("utf-8", errors="ignore").strip()
+                if not line:
+                    continue
+
+                out_write(line)
+                out_write("\n")
+                line_count += 1
+                if line_count % _FLUSH_EVERY == 0:
+                    sys.stdout.flush()
+                    last_flush = time.monotonic()
+
+                if "[M_SESSION_START]" in line:
+                    collecting = True
+                    monitor_start_wall = time.monotonic()
+                    if duration is not None:
+                        duration_deadline = monitor_start_wall + duration
+
+                if collecting:
+                    parsed = parse_row(line)
+                    if parsed:
+                        rows.append(parsed)
+                        total_rows += 1
+                        if spill_enabled and len(rows) >= _SPILL_CHUNK_ROWS:
+                            spill_rows()
+
+                    if not sent_stop and time.monotonic() >= duration_deadline:
+                        ser.write(b"x\n")
+                        sent_stop = True
+                        print("Duration reached. Sent stop command.")
 
-            print(line)
+                    if "[M_SESSION_END]" in line or "Monitoring stopped. Collected" in line:
+                        session_ended = True
+                        break
 
-            if "[M_SESSION_START]" in line:
-                collecting = True
-                monitor_start_wall = time.time()
+    sys.stdout.flush()
+    return total_rows
 
-            if collecting:
-                parsed = parse_row(line)
-                if parsed:
-                    rows.append(parsed)
 
-                if duration is not None and not sent_stop and monitor_start_wall is not None:
-                    if (time.time() - monitor_start_wall) >= duration:
-                        ser.write(b"x\n")
-                        ser.flush()
-                        sent_stop = True
-                        print("Duration reached. Sent stop command.")
+def _abs_diff_mean_kernel(a):
+    n = a.shape[0]
+    if n < 2:
+        return 0.0
+    s = 0.0
+    prev = a[0]
+    for i in range(1, n):
+        cur = a[i]
+        d = cur - prev
+        s += d if d >= 0 else -d
+        prev = cur
+    return s / (n - 1)
 
-                if "[M_SESSION_END]" in line or "Monitoring stopped. Collected" in line:
-                    break
 
-    if not rows:
-        raise RuntimeError(
-            "No monitoring samples captured. Verify COM port/baud and that firmware includes monitor output."
-        )
+_abs_diff_mean = None
+
 
-    df = pd.DataFrame(rows)
-    df.insert(0, "sample", range(1, len(df) + 1))
-    df["entry_interval_ms"] = (df["elapsed_s"].diff() * 1000.0).fillna(df["sample_ms"])
+def _get_abs_diff_mean():
+    # Fused single-pass diff/abs/mean: numba when available (one read of the
+    # array, no intermediates), otherwise the two-pass NumPy equivalent.
+    global _abs_diff_mean
+    if _abs_diff_mean is None:
+        try:
+            from numba import njit
 
-    return df
+            _abs_diff_mean = njit(cache=True, fastmath=True)(_abs_diff_mean_kernel)
+        except ImportError:
+            import numpy as np
+
+            def _numpy_fallback(a):
+                if a.shape[0] < 2:
+                    return 0.0
+                return float(np.abs(np.diff(a)).mean())
+
+            _abs_diff_mean = _numpy_fallback
+    return _abs_diff_mean
 
 
 def compute_summary(df: pd.DataFrame):
-    raw_step_mean = df["raw_adc"].diff().abs().iloc[1:].mean() if len(df) > 1 else 0.0
-    strain_step_mean = df["strain_uE"].diff().abs().iloc[1:].mean() if len(df) > 1 else 0.0
+    import numpy as np
+
+    raw_arr = df["raw_adc"].to_numpy(dtype=np.float64)
+    strain_arr = df["strain_uE"].to_numpy(dtype=np.float64)
+
+    abs_diff_mean = _get_abs_diff_mean()
+    raw_step_mean = float(abs_diff_mean(raw_arr))
+    strain_step_mean = float(abs_diff_mean(strain_arr))
+
+    # One agg dispatch instead of eight separate column reductions.
+    stats = df.agg(
+        {
+            "sample_ms": ["mean", "min", "max"],
+            "raw_adc": ["max", "min"],
+            "strain_uE": ["max", "min"],
+        }
+    )
 
     return {
         "samples": int(len(df)),
-        "sampling_total_s": float(df["elapsed_s"].iloc[-1]),
-        "sample_ms_avg": float(df["sample_ms"].mean()),
-        "sample_ms_min": int(df["sample_ms"].min()),
-        "sample_ms_max": int(df["sample_ms"].max()),
-        "raw_high": int(df["raw_adc"].max()),
-        "raw_low": int(df["raw_adc"].min()),
-        "strain_high_uE": float(df["strain_uE"].max()),
-        "strain_low_uE": float(df["strain_uE"].min()),
-        "avg_variation_raw_step": float(raw_step_mean),
-        "avg_variation_strain_step_uE": float(strain_step_mean),
+        "sampling_total_s": float(df["elapsed_s"].iat[-1]),
+        "sample_ms_avg": float(stats.at["mean", "sample_ms"]),
+        "sample_ms_min": int(stats.at["min", "sample_ms"]),
+        "sample_ms_max": int(stats.at["max", "sample_ms"]),
+        "raw_high": int(stats.at["max", "raw_adc"]),
+        "raw_low": int(stats.at["min", "raw_adc"]),
+        "strain_high_uE": float(stats.at["max", "strain_uE"]),
+        "strain_low_uE": float(stats.at["min", "strain_uE"]),
+        "avg_variation_raw_step": raw_step_mean,
+        "avg_variation_strain_step_uE": strain_step_mean,
     }
 
 
 def write_excel(df: pd.DataFrame, output_file: Path, run_label: str | None):
+    import numpy as np
+    import pandas as pd
+
     summary = compute_summary(df)
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    data_export = df[
-        [
-            "sample",
-            "elapsed_s",
-            "raw_adc",
-            "avg_20",
-            "filtered_20",
-            "zeroed_adc",
-            "strain_uE",
-            "sample_ms",
-            "entry_interval_ms",
-        ]
-    ].copy()
-    data_export.insert(7, " ", "")
-
-    with pd.ExcelWriter(output_file, engine="xlsxwriter") as writer:
+    # Columns written to the Data sheet; positions 0-6 then 8-9, leaving
+    # column H as a visual spacer via its narrow set_column width instead of
+    # copying the frame just to insert a column of empty strings.
+    data_columns = [
+        "sample",
+        "elapsed_s",
+        "raw_adc",
+        "avg_20",
+        "filtered_20",
+        "zeroed_adc",
+        "strain_uE",
+        "sample_ms",
+        "entry_interval_ms",
+    ]
+
+    # constant_memory flushes each completed row to disk, keeping workbook
+    # memory flat regardless of capture length. The trade-off is that every
+    # worksheet must be written in strictly increasing row order, so the
+    # sheet layout below is organised row-by-row rather than section-by-
+    # section, and the old whole-range conditional_format (which re-visits
+    # rows) is replaced by applying the highlight format as rows are written.
+    with pd.ExcelWriter(
+        output_file,
+        engine="xlsxwriter",
+        engine_kwargs={"options": {"constant_memory": True, "strings_to_numbers": False}},
+    ) as writer:
         workbook = writer.book
         ws_summary = workbook.add_worksheet("Summary")
         writer.sheets["Summary"] = ws_summary
 
-        data_export.to_excel(writer, sheet_name="Data", index=False, startrow=1)
-        ws_data = writer.sheets["Data"]
+        fmts = {name: workbook.add_format(spec) for name, spec in _FORMAT_SPECS.items()}
+        title_fmt = fmts["title"]
+        head_fmt = fmts["head"]
+        input_head_fmt = fmts["input_head"]
+        input_cell_fmt = fmts["input_cell"]
+        high_strain_fmt = fmts["high_strain"]
+        center_cell_fmt = fmts["center_cell"]
+        section_fmt = fmts["section"]
+        label_fmt = head_fmt
+        value_fmt = fmts["value"]
+        avg_value_fmt = fmts["avg_value"]
 
-        timing_df = df[["sample", "sample_ms"]].copy()
-        timing_df.rename(
-            columns={
-                "sample": "Sample",
-                "sample_ms": "Completion ms",
-            },
-            inplace=True,
-        )
-        timing_df.to_excel(writer, sheet_name="Timing", index=False, startrow=1)
-        ws_timing = writer.sheets["Timing"]
-
-        title_fmt = workbook.add_format({"bold": True, "font_size": 13, "align": "left", "valign": "vcenter"})
-        head_fmt = workbook.add_format({"bold": True, "bg_color": "#D9E1F2", "border": 1, "align": "center", "valign": "vcenter"})
-        input_head_fmt = workbook.add_format({"bold": True, "bg_color": "#FFF2CC", "border": 1, "align": "left", "valign": "vcenter"})
-        input_cell_fmt = workbook.add_format({"border": 1, "bg_color": "#FFFBE6", "align": "left", "valign": "vcenter"})
-        high_strain_fmt = workbook.add_format({"bg_color": "#FCE4D6", "font_color": "#9C0006"})
-        center_cell_fmt = workbook.add_format({"align": "center", "valign": "vcenter"})
+        ws_summary.set_column_pixels("A:C", 200)
+        ws_summary.set_column_pixels("E:F", 100)
 
         ws_summary.write(0, 0, "Test Conditions Label", input_head_fmt)
         ws_summary.merge_range(0, 1, 0, 5, run_label if run_label else "", input_cell_fmt)
@@ -245,10 +515,6 @@ def write_excel(df: pd.DataFrame, output_file: Path, run_label: str | None):
         ]
 
         stats_start = 8
-        section_fmt = workbook.add_format({"bold": True, "bg_color": "#4F81BD", "font_color": "#FFFFFF", "align": "center", "valign": "vcenter", "border": 1})
-        label_fmt = workbook.add_format({"bold": True, "bg_color": "#D9E1F2", "align": "center", "valign": "vcenter", "border": 1})
-        value_fmt = workbook.add_format({"align": "center", "valign": "vcenter", "border": 1})
-        avg_value_fmt = workbook.add_format({"bold": True, "bg_color": "#FFF2CC", "align": "center", "valign": "vcenter", "border": 1})
 
         # ADC Variation & Extremes
         ws_summary.merge_range(stats_start, 0, stats_start, 2, "ADC Variation & Extremes", section_fmt)
@@ -268,26 +534,26 @@ def write_excel(df: pd.DataFrame, output_file: Path, run_label: str | None):
         ws_summary.write(stats_start + 6, 1, summary["strain_low_uE"], value_fmt)
         ws_summary.write(stats_start + 6, 2, summary["avg_variation_strain_step_uE"], avg_value_fmt)
 
-        # Sample Time Variation & Extremes
+        # Sample Time Variation & Extremes. The meta cells in columns E:F
+        # land on the same rows as the labels/values here, so they are
+        # written in the same pass to keep the row order strictly increasing.
         ws_summary.merge_range(stats_start + 8, 0, stats_start + 8, 2, "Sample Time Variation & Extremes", section_fmt)
         ws_summary.write(stats_start + 9, 0, "Sample Time High (ms)", label_fmt)
         ws_summary.write(stats_start + 9, 1, "Sample Time Low (ms)", label_fmt)
         ws_summary.write(stats_start + 9, 2, "Avg Sample Time (ms)", label_fmt)
+        ws_summary.write(stats_start + 9, 4, meta_rows[0][0], label_fmt)
+        ws_summary.write(stats_start + 9, 5, meta_rows[0][1], value_fmt)
         ws_summary.write(stats_start + 10, 0, summary["sample_ms_max"], value_fmt)
         ws_summary.write(stats_start + 10, 1, summary["sample_ms_min"], value_fmt)
         ws_summary.write(stats_start + 10, 2, summary["sample_ms_avg"], avg_value_fmt)
+        ws_summary.write(stats_start + 10, 4, meta_rows[1][0], label_fmt)
+        ws_summary.write(stats_start + 10, 5, meta_rows[1][1], value_fmt)
 
         ws_summary.write(stats_start + 12, 0, "Timing details are available on the Timing tab.")
 
-        mrow = stats_start + 9
-        for key, value in meta_rows:
-            ws_summary.write(mrow, 4, key, label_fmt)
-            ws_summary.write(mrow, 5, value, value_fmt)
-            mrow += 1
-
         chart = workbook.add_chart({"type": "line"})
         data_first = 2
-        data_last = len(data_export) + 1
+        data_last = len(df) + 1
 
         chart.add_series(
             {
@@ -312,45 +578,91 @@ def write_excel(df: pd.DataFrame, output_file: Path, run_label: str | None):
 
         ws_summary.insert_chart(2, 7, chart, {"x_scale": 1.4, "y_scale": 1.4})
 
-        ws_summary.set_column_pixels("A:C", 200)
-        ws_summary.set_column_pixels("E:F", 100)
-
-        ws_data.write(0, 0, "Continuous Monitor Data")
+        # Write rows directly with xlsxwriter; to_excel routes every cell
+        # through pandas' ExcelFormatter, which dominates the export time.
+        ws_data = workbook.add_worksheet("Data")
+        writer.sheets["Data"] = ws_data
         ws_data.set_column_pixels("A:C", 200, center_cell_fmt)
         ws_data.set_column("D:G", 14, center_cell_fmt)
         ws_data.set_column("H:H", 3, center_cell_fmt)
         ws_data.set_column("I:J", 16, center_cell_fmt)
-        ws_data.write(0, 8, "Highlight Rule: |strain_uE| > 50")
 
-        data_first_row = 2
-        data_last_row = len(df) + 1
-        ws_data.conditional_format(
-            data_first_row,
-            0,
-            data_last_row,
-            7,
-            {
-                "type": "formula",
-                "criteria": "=OR($G2>50,$G2<-50)",
-                "format": high_strain_fmt,
-            },
-        )
+        ws_data.write(0, 0, "Continuous Monitor Data")
+        ws_data.write(0, 8, "Highlight Rule: |strain_uE| > 50")
+        ws_data.write_row(1, 0, data_columns[:7])
+        ws_data.write_row(1, 8, data_columns[7:])
+
+        # Highlight decision vectorized once up front rather than compared
+        # per row while writing.
+        strain_mask = (np.abs(df["strain_uE"].to_numpy()) > 50.0).tolist()
+        for i, row in enumerate(df[data_columns].to_numpy().tolist()):
+            fmt = high_strain_fmt if strain_mask[i] else None
+            ws_data.write_row(i + 2, 0, row[:7], fmt)
+            ws_data.write_row(i + 2, 8, row[7:], fmt)
+
+        ws_timing = workbook.add_worksheet("Timing")
+        writer.sheets["Timing"] = ws_timing
+        ws_timing.set_column_pixels("A:C", 200, center_cell_fmt)
+        ws_timing.set_column_pixels("E:F", 100)
 
         ws_timing.write(0, 0, "Per-Entry Timing")
-        ws_timing.set_column_pixels("A:C", 200, center_cell_fmt)
+        ws_timing.write(1, 0, "Sample")
+        ws_timing.write(1, 1, "Completion ms")
+
+        # Side summary cells occupy rows 2-7 in columns E:F; interleave them
+        # with the data rows so each row is only visited once.
+        timing_side = {
+            2: ("Timing Summary", None, head_fmt),
+            3: ("Total Samples", summary["samples"], value_fmt),
+            4: ("Total Time (s)", round(summary["sampling_total_s"], 3), value_fmt),
+            5: ("Completion ms Avg", round(summary["sample_ms_avg"], 2), avg_value_fmt),
+            6: ("Completion ms Min", summary["sample_ms_min"], value_fmt),
+            7: ("Completion ms Max", summary["sample_ms_max"], value_fmt),
+        }
+
+        # The two columns are written straight from df; no intermediate
+        # timing frame copy.
+        timing_samples = df["sample"].to_numpy().tolist()
+        timing_ms = df["sample_ms"].to_numpy().tolist()
+        for r in range(2, max(len(timing_samples) + 2, 8)):
+            data_idx = r - 2
+            if data_idx < len(timing_samples):
+                ws_timing.write(r, 0, timing_samples[data_idx])
+                ws_timing.write(r, 1, timing_ms[data_idx])
+            side = timing_side.get(r)
+            if side is not None:
+                key, value, fmt = side
+                ws_timing.write(r, 4, key, head_fmt)
+                if value is not None:
+                    ws_timing.write(r, 5, value, fmt)
+
+
+def write_excel_fast(df: pd.DataFrame, output_file: Path, run_label: str | None):
+    """Plain-value export via openpyxl's write-only mode for very large captures.
+
+    Trades the chart, strain highlighting, and Timing sheet for raw write
+    throughput and constant memory; the Summary sheet is reduced to a simple
+    key/value listing.
+    """
+    import openpyxl
 
-        ws_timing.write(2, 4, "Timing Summary", head_fmt)
-        ws_timing.write(3, 4, "Total Samples", head_fmt)
-        ws_timing.write(3, 5, summary["samples"], value_fmt)
-        ws_timing.write(4, 4, "Total Time (s)", head_fmt)
-        ws_timing.write(4, 5, round(summary["sampling_total_s"], 3), value_fmt)
-        ws_timing.write(5, 4, "Completion ms Avg", head_fmt)
-        ws_timing.write(5, 5, round(summary["sample_ms_avg"], 2), avg_value_fmt)
-        ws_timing.write(6, 4, "Completion ms Min", head_fmt)
-        ws_timing.write(6, 5, summary["sample_ms_min"], value_fmt)
-        ws_timing.write(7, 4, "Completion ms Max", head_fmt)
-        ws_timing.write(7, 5, summary["sample_ms_max"], value_fmt)
-        ws_timing.set_column_pixels("E:F", 100)
+    summary = compute_summary(df)
+    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    wb = openpyxl.Workbook(write_only=True)
+
+    ws_data = wb.create_sheet("Data")
+    ws_data.append(list(df.columns))
+    for row in df.to_numpy().tolist():
+        ws_data.append(row)
+
+    ws_summary = wb.create_sheet("Summary")
+    ws_summary.append(["Test Conditions Label", run_label if run_label else ""])
+    ws_summary.append(["Generated At", generated_at])
+    for key, value in summary.items():
+        ws_summary.append([key, value])
+
+    wb.save(output_file)
 
 
 def main():
@@ -377,16 +689,38 @@ def main():
         default="",
         help="Optional test-condition label included in filename and Summary sheet.",
     )
+    parser.add_argument(
+        "--fast-export",
+        action="store_true",
+        help="Write plain values only (no chart, highlighting, or Timing sheet) for very large captures.",
+    )
 
     args = parser.parse_args()
 
+    # Block-buffer stdout; the capture loops flush every _FLUSH_EVERY lines
+    # instead of paying a flush syscall per echoed serial line.
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
+    # Fail on a missing openpyxl before the capture runs, not after the
+    # session's samples are already collected and about to be exported.
+    if args.fast_export:
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            print("ERROR: --fast-export requires the openpyxl package (pip install openpyxl).")
+            sys.exit(1)
+
     workspace_root = Path(__file__).resolve().parents[1]
     run_label = args.label.strip() if args.label else ""
     output_file = build_output_path_with_label(workspace_root, run_label if run_label else None)
 
     try:
         df = capture_monitor_session(args.port, args.baud, args.duration, args.timeout)
-        write_excel(df, output_file, run_label if run_label else None)
+        if args.fast_export:
+            write_excel_fast(df, output_file, run_label if run_label else None)
+        else:
+            write_excel(df, output_file, run_label if run_label else None)
     except Exception as exc:
         print(f"ERROR: {exc}")
         sys.exit(1)